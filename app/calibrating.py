@@ -8,9 +8,15 @@ but adapted for the web interface with step-by-step guidance.
 import logging
 import threading
 import time
-import traceback
-from dataclasses import asdict, dataclass
-from typing import Optional, Dict, Any
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Optional, Dict, Any, Tuple, Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy path below is used instead
+    njit = None
 
 from lerobot.common.robots import (
     Robot,
@@ -28,6 +34,68 @@ from lerobot.common.utils.utils import init_logging
 
 logger = logging.getLogger(__name__)
 
+# Recorded ranges are republished to the status at most this often (10Hz)
+_PUBLISH_INTERVAL = 0.1
+
+# Readings outside this open interval are treated as invalid (0, negative, or extreme values)
+_POS_MIN_EXCLUSIVE = 0
+_POS_MAX_EXCLUSIVE = 5000
+
+
+def _valid_position(pos) -> bool:
+    """Reject clearly invalid readings (0, negative, or extreme values)"""
+    return _POS_MIN_EXCLUSIVE < pos < _POS_MAX_EXCLUSIVE
+
+
+def _valid_positions_mask(pos: np.ndarray) -> np.ndarray:
+    """Vectorized _valid_position for an int32 position array"""
+    # Viewed as unsigned, pos - (min + 1) wraps the low bound and below to huge values,
+    # so one compare covers both bounds
+    low = _POS_MIN_EXCLUSIVE + 1
+    return (pos.view(np.uint32) - np.uint32(low)) < np.uint32(_POS_MAX_EXCLUSIVE - low)
+
+
+def _update_ranges_numpy(pos: np.ndarray, current: np.ndarray, mins: np.ndarray, maxes: np.ndarray) -> bool:
+    """Fold one reading into current/min/max in place, returning whether anything changed"""
+    valid = _valid_positions_mask(pos)
+    # A value equal to current is already inside [min, max], so nothing else can change
+    if not (valid & (pos != current)).any():
+        return False
+    np.copyto(current, pos, where=valid)
+    np.minimum(mins, pos, out=mins, where=valid)
+    np.maximum(maxes, pos, out=maxes, where=valid)
+    return True
+
+
+def _update_ranges_loop(pos, current, mins, maxes):
+    """Scalar-loop equivalent of _update_ranges_numpy, written for numba"""
+    changed = False
+    for i in range(pos.size):
+        p = pos[i]
+        if _POS_MIN_EXCLUSIVE < p < _POS_MAX_EXCLUSIVE and p != current[i]:
+            current[i] = p
+            if p < mins[i]:
+                mins[i] = p
+            if p > maxes[i]:
+                maxes[i] = p
+            changed = True
+    return changed
+
+
+# Compiled with numba and cached on disk when it is installed
+_update_ranges = njit(cache=True)(_update_ranges_loop) if njit is not None else _update_ranges_numpy
+
+
+def _warm_up_update_ranges():
+    """Trigger numba compilation (or its disk-cache load) with the recorder's int32 signature"""
+    probe = np.zeros(1, dtype=np.int32)
+    _update_ranges(probe, probe.copy(), probe.copy(), probe.copy())
+
+
+# Pay the JIT cost at import rather than on the first 20Hz recorder tick
+if njit is not None:
+    _warm_up_update_ranges()
+
 
 @dataclass
 class CalibrationStatus:
@@ -43,6 +111,9 @@ class CalibrationStatus:
     recorded_ranges: Dict[str, Dict[str, float]] = None  # {motor: {min: val, max: val, current: val}}
 
 
+_STATUS_FIELDS = frozenset(f.name for f in fields(CalibrationStatus))
+
+
 @dataclass
 class CalibrationRequest:
     """Request parameters for starting calibration"""
@@ -56,114 +127,99 @@ class CalibrationManager:
 
     def __init__(self):
         self.status = CalibrationStatus()
+        # Bumped on every status replacement so readers can cache derived views
+        self.status_version = 0
+        # Invoked after a calibration file is written, so config listings can drop cached stats
+        self.on_calibration_saved: Optional[Callable[[], None]] = None
         self.device: Optional[Robot | Teleoperator] = None
+        # Daemon so a worker stuck in a bus call never blocks process exit
         self.calibration_thread: Optional[threading.Thread] = None
-        self.stop_calibration = False
-        self._status_lock = threading.Lock()
+        # Single source of truth for stop requests; waits can block on it directly
+        self._stop_event = threading.Event()
+        # Reentrant so a check-and-claim section can call _update_status
+        self._status_lock = threading.RLock()
         self._step_complete = threading.Event()
+        # Held around every device bus call (connect, reads, writes, disconnect) so an HTTP
+        # stop can never touch the port while the worker has a transaction in flight
+        self._bus_lock = threading.Lock()
         self._recording_active = False
         self._start_positions = {}
-        self._mins = {}
-        self._maxes = {}
+        # Range tracking is kept as parallel arrays indexed like _motor_names
+        self._motor_names: Tuple[str, ...] = ()
+        self._mins = np.empty(0, dtype=np.int32)
+        self._maxes = np.empty(0, dtype=np.int32)
+        self._current = np.empty(0, dtype=np.int32)
         self._homing_offsets = {}
+        self._ranges_dirty = False
+        self._last_publish = 0.0
         
         # Initialize logging
         init_logging()
 
     def get_status(self) -> CalibrationStatus:
         """Get current calibration status"""
-        with self._status_lock:
-            # Update current positions if we're recording and device is connected
-            if self.status.status == "recording" and self.device and self.device.is_connected:
-                try:
-                    # Try reading positions with quick retry on port contention
-                    positions = None
-                    for attempt in range(2):  # Quick retry for status updates
-                        try:
-                            positions = self.device.bus.sync_read("Present_Position", normalize=False)
-                            break
-                        except Exception as read_error:
-                            if "Port is in use" in str(read_error) and attempt < 1:
-                                time.sleep(0.005)  # Very short delay
-                                continue
-                            else:
-                                raise read_error
-                    
-                    if positions:
-                        # Update recorded ranges
-                        if not self.status.recorded_ranges:
-                            self.status.recorded_ranges = {}
-                        
-                        for motor, pos in positions.items():
-                            # Filter out invalid readings (0, negative, or extreme values)
-                            if pos <= 0 or pos >= 5000:
-                                continue  # Skip invalid readings
-                                
-                            if motor not in self.status.recorded_ranges:
-                                self.status.recorded_ranges[motor] = {
-                                    "min": pos, "max": pos, "current": pos
-                                }
-                            else:
-                                self.status.recorded_ranges[motor]["current"] = pos
-                                self.status.recorded_ranges[motor]["min"] = min(
-                                    self.status.recorded_ranges[motor]["min"], pos
-                                )
-                                self.status.recorded_ranges[motor]["max"] = max(
-                                    self.status.recorded_ranges[motor]["max"], pos
-                                )
-                except Exception as e:
-                    # Reduce log spam by using debug level for expected port contention
-                    if "Port is in use" in str(e):
-                        logger.debug(f"Port busy during position read: {e}")
-                    else:
-                        logger.warning(f"Failed to read positions: {e}")
-            
-            return self.status
+        # Positions are published by the recording worker; never touch the bus here.
+        # The status object is replaced on every update, so the reference is a snapshot.
+        return self.status
 
     def _update_status(self, **kwargs):
         """Update calibration status thread-safely"""
+        changes = {key: value for key, value in kwargs.items() if key in _STATUS_FIELDS}
         with self._status_lock:
-            for key, value in kwargs.items():
-                if hasattr(self.status, key):
-                    setattr(self.status, key, value)
+            self.status = replace(self.status, **changes)
+            self.status_version += 1
 
     def start_calibration(self, request: CalibrationRequest) -> Dict[str, Any]:
         """Start calibration process"""
         try:
+            # Lock-free fast path: the status reference is swapped atomically
             if self.status.calibration_active:
                 return {"success": False, "message": "Calibration already active"}
 
-            # Reset status and clear any previous calibration data
+            with self._status_lock:
+                # Re-check under the lock so concurrent starts cannot both proceed
+                if self.status.calibration_active:
+                    return {"success": False, "message": "Calibration already active"}
+
+                # Single worker slot: a worker that outlived the stop timeout must exit first
+                if self.calibration_thread is not None and self.calibration_thread.is_alive():
+                    return {"success": False, "message": "Previous calibration is still stopping"}
+
+                self._update_status(
+                    calibration_active=True,
+                    status="connecting",
+                    device_type=request.device_type,
+                    error=None,
+                    message=f"Starting calibration for {request.device_type}",
+                    step=0,
+                    current_positions=None,
+                    recorded_ranges=None
+                )
+
+            # Clear any previous calibration data
             self._start_positions = {}
-            self._mins = {}
-            self._maxes = {}
+            self._motor_names = ()
+            self._mins = np.empty(0, dtype=np.int32)
+            self._maxes = np.empty(0, dtype=np.int32)
+            self._current = np.empty(0, dtype=np.int32)
             self._homing_offsets = {}
-            
-            self._update_status(
-                calibration_active=True,
-                status="connecting",
-                device_type=request.device_type,
-                error=None,
-                message=f"Starting calibration for {request.device_type}",
-                step=0,
-                current_positions=None,
-                recorded_ranges=None
-            )
+            self._ranges_dirty = False
 
             # Start calibration in a separate thread
             self.calibration_thread = threading.Thread(
                 target=self._calibration_worker,
                 args=(request,),
+                name="calib",
                 daemon=True
             )
-            self.stop_calibration = False
+            self._stop_event.clear()
             self._step_complete.clear()
             self.calibration_thread.start()
 
             return {"success": True, "message": "Calibration started"}
 
         except Exception as e:
-            logger.error(f"Error starting calibration: {e}")
+            logger.error("Error starting calibration: %s", e)
             self._update_status(
                 calibration_active=False,
                 status="error",
@@ -175,25 +231,27 @@ class CalibrationManager:
     def complete_step(self) -> Dict[str, Any]:
         """Complete the current calibration step"""
         try:
-            if not self.status.calibration_active:
+            # Read one snapshot so active/status are checked consistently
+            status = self.status
+            if not status.calibration_active:
                 return {"success": False, "message": "No calibration active"}
 
-            if self.status.status == "homing":
+            if status.status == "homing":
                 # Complete homing step
                 self._step_complete.set()
                 return {"success": True, "message": "Homing position set"}
             
-            elif self.status.status == "recording":
+            elif status.status == "recording":
                 # Complete recording step
                 self._recording_active = False
                 self._step_complete.set()
                 return {"success": True, "message": "Range recording completed"}
             
             else:
-                return {"success": False, "message": f"Cannot complete step in status: {self.status.status}"}
+                return {"success": False, "message": f"Cannot complete step in status: {status.status}"}
 
         except Exception as e:
-            logger.error(f"Error completing step: {e}")
+            logger.error("Error completing step: %s", e)
             return {"success": False, "message": str(e)}
 
     def stop_calibration_process(self) -> Dict[str, Any]:
@@ -203,7 +261,7 @@ class CalibrationManager:
                 return {"success": False, "message": "No calibration active"}
 
             logger.info("Stopping calibration process...")
-            self.stop_calibration = True
+            self._stop_event.set()
             self._recording_active = False
             self._step_complete.set()  # Unblock any waiting step
             
@@ -227,15 +285,20 @@ class CalibrationManager:
             return {"success": True, "message": "Calibration stopped"}
 
         except Exception as e:
-            logger.error(f"Error stopping calibration: {e}")
+            logger.error("Error stopping calibration: %s", e)
             # Force cleanup on error too
             self._cleanup_and_finish("Calibration stopped with error", status="error")
             return {"success": False, "message": str(e)}
 
+    def shutdown(self):
+        """Stop any active calibration so the device is released before exit"""
+        if self.status.calibration_active:
+            self.stop_calibration_process()
+
     def _calibration_worker(self, request: CalibrationRequest):
         """Worker thread for calibration process"""
         try:
-            logger.info(f"Starting calibration worker for {request.device_type}")
+            logger.info("Starting calibration worker for %s", request.device_type)
             
             # Create device configuration
             if request.device_type == "robot":
@@ -265,9 +328,10 @@ class CalibrationManager:
                 self.device = make_teleoperator_from_config(config)
 
             logger.info("Connecting to device...")
-            self.device.connect(calibrate=False)
+            with self._bus_lock:
+                self.device.connect(calibrate=False)
 
-            if self.stop_calibration:
+            if self._stop_event.is_set():
                 logger.info("Calibration stopped after device connection")
                 self._cleanup_and_finish("Calibration cancelled")
                 return
@@ -275,7 +339,7 @@ class CalibrationManager:
             # Start Step 1: Homing
             self._step_homing()
 
-            if self.stop_calibration:
+            if self._stop_event.is_set():
                 logger.info("Calibration stopped after homing step")
                 self._cleanup_and_finish("Calibration cancelled")
                 return
@@ -283,7 +347,7 @@ class CalibrationManager:
             # Start Step 2: Range Recording
             self._step_range_recording()
 
-            if self.stop_calibration:
+            if self._stop_event.is_set():
                 logger.info("Calibration stopped after recording step")
                 self._cleanup_and_finish("Calibration cancelled")
                 return
@@ -295,8 +359,7 @@ class CalibrationManager:
             self._cleanup_and_finish("Calibration completed successfully", status="completed")
 
         except Exception as e:
-            logger.error(f"Calibration error: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Calibration error: %s", e)
             # Ensure cleanup happens even on error
             self._cleanup_and_finish(f"Calibration failed: {e}", status="error")
         finally:
@@ -306,14 +369,24 @@ class CalibrationManager:
                 logger.warning("Worker thread ending but calibration still marked as active - forcing cleanup")
                 self._cleanup_and_finish("Calibration stopped", status="idle")
 
+    def _read_positions(self) -> Dict[str, int]:
+        """Read raw Present_Position for all motors in a single bus transaction"""
+        # Every bus call holds _bus_lock, so this process never contends with itself for the port
+        with self._bus_lock:
+            return self.device.bus.sync_read("Present_Position", normalize=False)
+
     def _step_homing(self):
         """Step 1: Set homing position"""
         logger.info("Starting homing step")
         
-        # Disable torque to allow manual movement
-        self.device.bus.disable_torque()
-        for motor in self.device.bus.motors:
-            self.device.bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
+        with self._bus_lock:
+            # Disable torque to allow manual movement
+            self.device.bus.disable_torque()
+            # One SYNC_WRITE transaction instead of a packet per motor
+            self.device.bus.sync_write(
+                "Operating_Mode",
+                {motor: OperatingMode.POSITION.value for motor in self.device.bus.motors},
+            )
 
         self._update_status(
             status="homing",
@@ -322,24 +395,26 @@ class CalibrationManager:
         )
 
         # Wait for user to complete step
-        while not self._step_complete.is_set() and not self.stop_calibration:
-            time.sleep(0.1)
+        while not self._step_complete.wait(timeout=0.5):
+            if self._stop_event.is_set():
+                break
 
-        if self.stop_calibration:
+        if self._stop_event.is_set():
             logger.info("Homing step cancelled due to stop request")
             return
 
         # Set homing offsets
         logger.info("Setting homing offsets...")
-        self.device.bus.reset_calibration()
-        actual_positions = self.device.bus.sync_read("Present_Position", normalize=False)
-        logger.info(f"Current positions for homing: {actual_positions}")
+        with self._bus_lock:
+            self.device.bus.reset_calibration()
+        actual_positions = self._read_positions()
+        logger.info("Current positions for homing: %s", actual_positions)
         
         self._homing_offsets = self.device.bus._get_half_turn_homings(actual_positions)
-        logger.info(f"Calculated homing offsets: {self._homing_offsets}")
+        logger.info("Calculated homing offsets: %s", self._homing_offsets)
         
-        for motor, offset in self._homing_offsets.items():
-            self.device.bus.write("Homing_Offset", motor, offset)
+        with self._bus_lock:
+            self.device.bus.sync_write("Homing_Offset", self._homing_offsets)
 
         self._step_complete.clear()
         logger.info("Homing step completed")
@@ -352,144 +427,184 @@ class CalibrationManager:
         self._start_positions = {}
         for attempt in range(5):  # Try multiple times to get valid initial positions
             try:
-                positions = self.device.bus.sync_read("Present_Position", normalize=False)
+                positions = self._read_positions()
                 # Validate initial positions
                 valid_positions = {}
                 for motor, pos in positions.items():
-                    if pos > 0 and pos < 5000:  # Valid range
+                    if _valid_position(pos):
                         valid_positions[motor] = pos
                 
                 if len(valid_positions) == len(positions):  # All positions are valid
                     self._start_positions = valid_positions
                     break
                 else:
-                    logger.warning(f"Attempt {attempt + 1}: Got invalid initial positions, retrying...")
+                    logger.warning("Attempt %d: Got invalid initial positions, retrying...", attempt + 1)
                     time.sleep(0.1)
             except Exception as e:
-                logger.warning(f"Attempt {attempt + 1}: Failed to read initial positions: {e}")
+                logger.warning("Attempt %d: Failed to read initial positions: %s", attempt + 1, e)
                 time.sleep(0.1)
         
         if not self._start_positions:
             raise RuntimeError("Could not get valid initial positions after multiple attempts")
         
-        logger.info(f"Starting positions for range recording: {self._start_positions}")
+        logger.info("Starting positions for range recording: %s", self._start_positions)
         
-        self._mins = self._start_positions.copy()
-        self._maxes = self._start_positions.copy()
-        logger.info(f"Initialized mins: {self._mins}")
-        logger.info(f"Initialized maxes: {self._maxes}")
+        self._motor_names = tuple(self._start_positions)
+        start = np.fromiter(
+            self._start_positions.values(), dtype=np.int32, count=len(self._motor_names)
+        )
+        self._mins = start.copy()
+        self._maxes = start.copy()
+        self._current = start.copy()
+        # Both start from the same positions
+        logger.info("Initialized mins and maxes: %s", self._start_positions)
         
         self._update_status(
             status="recording",
             step=2,
+            current_positions=dict(self._start_positions),
             message="Move ALL joints through their FULL ranges of motion - from minimum to maximum positions. Ensure each joint moves significantly from its starting position.",
-            recorded_ranges={motor: {"min": pos, "max": pos, "current": pos} 
-                           for motor, pos in self._start_positions.items()}
+            recorded_ranges=self._ranges_as_dict()
         )
 
         self._recording_active = True
 
         # Record positions until user completes step
-        while not self._step_complete.is_set() and not self.stop_calibration:
+        while not self._step_complete.is_set() and not self._stop_event.is_set():
             try:
-                # Try reading positions with retry on port contention
-                positions = None
-                for attempt in range(3):  # Try up to 3 times
-                    try:
-                        positions = self.device.bus.sync_read("Present_Position", normalize=False)
-                        break  # Success, exit retry loop
-                    except Exception as read_error:
-                        if "Port is in use" in str(read_error) and attempt < 2:
-                            time.sleep(0.01)  # Short delay before retry
-                            continue
-                        else:
-                            raise read_error  # Re-raise if not port contention or final attempt
-                
+                # pyserial releases the GIL while blocked on the port, so HTTP handlers keep
+                # serving the published snapshot while this read is in flight.
+                positions = self._read_positions()
+
                 if positions:
-                    # Validate the readings - filter out invalid/zero values
-                    valid_positions = {}
-                    for motor, pos in positions.items():
-                        # Filter out clearly invalid readings (0, negative, or extreme values)
-                        if pos > 0 and pos < 5000:  # Reasonable range for motor positions
-                            valid_positions[motor] = pos
-                        else:
-                            logger.debug(f"Filtered invalid position for {motor}: {pos}")
+                    pos = np.fromiter(
+                        (positions[motor] for motor in self._motor_names),
+                        dtype=np.int32,
+                        count=len(self._motor_names),
+                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for i in np.flatnonzero(~_valid_positions_mask(pos)):
+                            logger.debug("Filtered invalid position for %s: %s", self._motor_names[i], pos[i])
                     
-                    # Only update if we have valid readings
-                    if valid_positions:
-                        for motor, pos in valid_positions.items():
-                            if motor in self._mins:
-                                self._mins[motor] = min(self._mins[motor], pos)
-                                self._maxes[motor] = max(self._maxes[motor], pos)
+                    # Only mark for republish when a valid reading moved
+                    if _update_ranges(pos, self._current, self._mins, self._maxes):
+                        self._ranges_dirty = True
+
+                    # Coalesce updates: the UI polls far slower than the recorder ticks
+                    if self._ranges_dirty and time.monotonic() - self._last_publish >= _PUBLISH_INTERVAL:
+                        self._publish_ranges()
                 
-                time.sleep(0.05)  # 20Hz update rate
+                # 20Hz update rate; wakes immediately when the step is completed or stopped
+                self._step_complete.wait(0.05)
             except Exception as e:
-                if "Port is in use" in str(e):
-                    logger.debug(f"Port busy during position read: {e}")
-                else:
-                    logger.warning(f"Error reading positions during recording: {e}")
-                # Increase sleep time on error to reduce port contention
-                time.sleep(0.2)
+                logger.warning("Error reading positions during recording: %s", e)
+                # Back off longer on error rather than hammering a failing bus
+                self._step_complete.wait(0.2)
 
-        if self.stop_calibration:
+        if self._stop_event.is_set():
             logger.info("Range recording step cancelled due to stop request")
             return
+
+        # Flush anything recorded since the last coalesced publish
+        if self._ranges_dirty:
+            self._publish_ranges()
                 
+        range_diffs = self._maxes - self._mins
+
         # Log the final recorded ranges for debugging
         logger.info("Final recorded ranges:")
-        for motor in self._mins.keys():
-            logger.info(f"  {motor}: min={self._mins[motor]}, max={self._maxes[motor]}, range={self._maxes[motor] - self._mins[motor]}")
+        for i, motor in enumerate(self._motor_names):
+            logger.info("  %s: min=%s, max=%s, range=%s", motor, self._mins[i], self._maxes[i], range_diffs[i])
 
         # Validate ranges
-        same_min_max = [motor for motor in self._mins.keys() if self._mins[motor] == self._maxes[motor]]
-        if same_min_max:
-            raise ValueError(f"Some motors have the same min and max values: {same_min_max}")
-
-        # Check for insufficient range movement (less than 100 motor steps)
-        insufficient_range = []
-        for motor in self._mins.keys():
-            range_diff = self._maxes[motor] - self._mins[motor]
-            if range_diff < 100:  # Less than 100 motor steps seems insufficient
-                insufficient_range.append(f"{motor}: {range_diff}")
+        same_min_max = np.flatnonzero(range_diffs == 0)
+        if same_min_max.size:
+            raise ValueError(
+                f"Some motors have the same min and max values: {[self._motor_names[i] for i in same_min_max]}"
+            )
+
+        # Check for insufficient range movement (less than 100 motor steps seems insufficient)
+        insufficient_range = [
+            f"{self._motor_names[i]}: {range_diffs[i]}" for i in np.flatnonzero(range_diffs < 100)
+        ]
         
         if insufficient_range:
-            logger.warning(f"Some motors may not have been moved through sufficient range: {insufficient_range}")
+            logger.warning("Some motors may not have been moved through sufficient range: %s", insufficient_range)
             logger.warning("Consider moving all joints through their full range of motion during calibration")
 
         self._step_complete.clear()
         logger.info("Range recording step completed")
 
+    def _ranges_as_dict(self) -> Dict[str, Dict[str, int]]:
+        """Convert the recorded range arrays to the {motor: {min, max, current}} status shape"""
+        # Rows are rebuilt rather than mutated in place: published snapshots are shared with readers
+        return {
+            motor: {"min": lo, "max": hi, "current": cur}
+            for motor, lo, hi, cur in zip(
+                self._motor_names,
+                self._mins.tolist(),
+                self._maxes.tolist(),
+                self._current.tolist(),
+            )
+        }
+
+    def _publish_ranges(self):
+        """Publish the latest positions and recorded ranges for status polling"""
+        self._ranges_dirty = False
+        self._last_publish = time.monotonic()
+        self._update_status(
+            current_positions=dict(zip(self._motor_names, self._current.tolist())),
+            recorded_ranges=self._ranges_as_dict(),
+        )
+
     def _complete_calibration(self):
         """Complete the calibration and save results"""
         logger.info("Completing calibration...")
 
+        # Resolve each motor's id/model and recorded range once
+        index = {motor: i for i, motor in enumerate(self._motor_names)}
+        mins = self._mins.tolist()
+        maxes = self._maxes.tolist()
+        motors = [
+            (motor, m.id, m.model, mins[index[motor]], maxes[index[motor]])
+            for motor, m in self.device.bus.motors.items()
+        ]
+
         # Log motor information for debugging
-        logger.info("Motor configuration:")
-        for motor, m in self.device.bus.motors.items():
-            logger.info(f"  {motor}: ID={m.id}, Model={m.model}")
+        logger.info(
+            "Motor configuration:\n%s",
+            "\n".join(f"  {motor}: ID={motor_id}, Model={model}" for motor, motor_id, model, _, _ in motors),
+        )
 
         # Create calibration dict
-        calibration = {}
-        for motor, m in self.device.bus.motors.items():
-            calibration[motor] = MotorCalibration(
-                id=m.id,
+        calibration = {
+            motor: MotorCalibration(
+                id=motor_id,
                 drive_mode=0,
                 homing_offset=self._homing_offsets[motor],
-                range_min=self._mins[motor],
-                range_max=self._maxes[motor],
+                range_min=range_min,
+                range_max=range_max,
             )
-            logger.info(f"Calibration for {motor}: "
-                       f"ID={m.id}, "
-                       f"homing_offset={self._homing_offsets[motor]}, "
-                       f"range_min={self._mins[motor]}, "
-                       f"range_max={self._maxes[motor]}")
+            for motor, motor_id, _, range_min, range_max in motors
+        }
+        logger.info(
+            "Calibration:\n%s",
+            "\n".join(
+                f"  {motor}: ID={c.id}, homing_offset={c.homing_offset}, "
+                f"range_min={c.range_min}, range_max={c.range_max}"
+                for motor, c in calibration.items()
+            ),
+        )
 
         # Write and save calibration
         self.device.calibration = calibration
-        self.device.bus.write_calibration(calibration)
+        with self._bus_lock:
+            self.device.bus.write_calibration(calibration)
         self.device._save_calibration()
+        if self.on_calibration_saved is not None:
+            self.on_calibration_saved()
         
-        logger.info(f"Calibration saved to {self.device.calibration_fpath}")
+        logger.info("Calibration saved to %s", self.device.calibration_fpath)
 
     def _cleanup_and_finish(self, message: str, status: str = "completed"):
         """Clean up and finish calibration"""
@@ -503,13 +618,20 @@ class CalibrationManager:
 
     def _cleanup_device(self):
         """Clean up device connection"""
+        # Wait for an in-flight bus call to finish, but never hang a stop request on a wedged bus
+        locked = self._bus_lock.acquire(timeout=5.0)
+        if not locked:
+            logger.warning("Bus still busy after 5s, disconnecting anyway")
         try:
             if self.device:
                 logger.info("Disconnecting device...")
                 self.device.disconnect()
                 self.device = None
         except Exception as e:
-            logger.error(f"Error disconnecting device: {e}")
+            logger.error("Error disconnecting device: %s", e)
+        finally:
+            if locked:
+                self._bus_lock.release()
 
 
 # Global calibration manager instance
@@ -1,4 +1,5 @@
 import os
+import functools
 import shutil
 import logging
 import platform
@@ -27,6 +28,26 @@ CONFIG_STORAGE_PATH = os.path.expanduser("~/.cache/huggingface/lerobot/saved_con
 LEADER_CONFIG_FILE = os.path.join(CONFIG_STORAGE_PATH, "leader_config.txt")
 FOLLOWER_CONFIG_FILE = os.path.join(CONFIG_STORAGE_PATH, "follower_config.txt")
 
+
+def _file_mtime_ns(path):
+    """Modification time of a file in nanoseconds, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _read_saved_value(path, mtime_ns):
+    """Stripped contents of a saved port/config file, cached per file mtime"""
+    if mtime_ns is None:
+        return None
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
 def setup_calibration_files(leader_config: str, follower_config: str):
     """Setup calibration files in the correct locations for teleoperation and recording"""
     # Extract config names from file paths (remove .json extension)
@@ -187,6 +208,7 @@ def save_robot_port(robot_type, port):
     
     with open(port_file, 'w') as f:
         f.write(port)
+    _read_saved_value.cache_clear()
     
     logger.info(f"Saved {robot_type} port: {port}")
 
@@ -203,11 +225,10 @@ def get_saved_robot_port(robot_type):
     """
     port_file = LEADER_PORT_FILE if robot_type == "leader" else FOLLOWER_PORT_FILE
     
-    if os.path.exists(port_file):
-        with open(port_file, 'r') as f:
-            port = f.read().strip()
-            logger.info(f"Retrieved saved {robot_type} port: {port}")
-            return port
+    port = _read_saved_value(port_file, _file_mtime_ns(port_file))
+    if port is not None:
+        logger.info(f"Retrieved saved {robot_type} port: {port}")
+        return port
     
     logger.info(f"No saved port found for {robot_type}")
     return None
@@ -252,6 +273,7 @@ def save_robot_config(robot_type: str, config_name: str):
         # Write the config name to file
         with open(config_file_path, 'w') as f:
             f.write(config_name.strip())
+        _read_saved_value.cache_clear()
             
         logger.info(f"Saved {robot_type} configuration: {config_name}")
         return True
@@ -274,12 +296,10 @@ def get_saved_robot_config(robot_type: str):
             return None
             
         # Read the config name from file
-        if os.path.exists(config_file_path):
-            with open(config_file_path, 'r') as f:
-                config_name = f.read().strip()
-                if config_name:
-                    logger.info(f"Found saved {robot_type} configuration: {config_name}")
-                    return config_name
+        config_name = _read_saved_value(config_file_path, _file_mtime_ns(config_file_path))
+        if config_name:
+            logger.info(f"Found saved {robot_type} configuration: {config_name}")
+            return config_name
                     
         logger.info(f"No saved {robot_type} configuration found")
         return None
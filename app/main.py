@@ -1,17 +1,29 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import os
 import logging
-import glob
+import functools
+import platform
+import time
 import asyncio
-from typing import List, Dict, Any
-import threading
-import queue
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from . import config
 
+try:
+    import cv2
+
+    _HAVE_CV2 = True
+except ImportError:
+    # OpenCV is optional; camera detection then reports no cameras
+    cv2 = None
+    _HAVE_CV2 = False
+
 # Import our custom recording functionality
 from .recording import (
     RecordingRequest,
@@ -54,6 +66,7 @@ from .replaying import (
     handle_stop_replay,
     handle_replay_status,
     handle_replay_logs,
+    cleanup as replay_cleanup,
 )
 
 
@@ -65,7 +78,7 @@ logger = logging.getLogger(__name__)
 connected_websockets: List[WebSocket] = []
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -76,6 +89,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Compress larger JSON responses such as the calibration config listings
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Create static directory if it doesn't exist
 os.makedirs("app/static", exist_ok=True)
 
@@ -101,106 +117,184 @@ from .config import (
 )
 
 
+# Frames buffered per client before the oldest is dropped for a slow reader
+CLIENT_OUTBOX_SIZE = 32
+# Joint-data broadcast coalescing: max updates per frame and how long to wait for more.
+# Legacy clients get a batch unrolled into one frame per update, so a batch must fit an outbox.
+BROADCAST_BATCH_SIZE = CLIENT_OUTBOX_SIZE
+BROADCAST_COALESCE_WINDOW = 0.005
+# Same options ORJSONResponse uses; robot observations may carry numpy scalars
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.broadcast_queue = queue.Queue()
-        self.broadcast_thread = None
-        self.is_running = False
+        self.active_connections: Set[WebSocket] = set()
+        # Mirrors bool(active_connections) so producers can bail out with a single load
+        self._has_listeners = False
+        # Per-client outgoing frames and the task draining each of them
+        self._outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        # Clients that opted in to joint_batch frames with ?batch=1
+        self._batching: Set[WebSocket] = set()
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.broadcast_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._consumer_task: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        self._has_listeners = True
+        outbox = asyncio.Queue(maxsize=CLIENT_OUTBOX_SIZE)
+        self._outboxes[websocket] = outbox
+        if websocket.query_params.get("batch") == "1":
+            self._batching.add(websocket)
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, outbox))
         logger.info(
             f"WebSocket connected. Total connections: {len(self.active_connections)}"
         )
 
-        # Start broadcast thread if not running
-        if not self.is_running:
-            self.start_broadcast_thread()
+        # Start the broadcast consumer on the server's event loop if not running
+        if self._consumer_task is None or self._consumer_task.done():
+            self.loop = asyncio.get_running_loop()
+            self._consumer_task = asyncio.create_task(self._broadcast_consumer())
+            logger.info("📡 Broadcast consumer started")
 
     def disconnect(self, websocket: WebSocket):
+        self._outboxes.pop(websocket, None)
+        self._batching.discard(websocket)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
+            self._has_listeners = bool(self.active_connections)
             logger.info(
                 f"WebSocket disconnected. Total connections: {len(self.active_connections)}"
             )
 
-        # Stop broadcast thread if no connections
-        if not self.active_connections and self.is_running:
-            self.stop_broadcast_thread()
-
-    def start_broadcast_thread(self):
-        """Start the background thread for broadcasting data"""
-        if self.is_running:
-            return
-
-        self.is_running = True
-        self.broadcast_thread = threading.Thread(
-            target=self._broadcast_worker, daemon=True
-        )
-        self.broadcast_thread.start()
-        logger.info("📡 Broadcast thread started")
+    async def _sender(self, websocket: WebSocket, outbox: asyncio.Queue):
+        """Write one client's queued frames so a slow client only delays itself"""
+        try:
+            while True:
+                payload = await outbox.get()
+                await websocket.send_text(payload)
+        except Exception as e:
+            logger.error(f"Error sending data to WebSocket: {e}")
+            self.disconnect(websocket)
+
+    async def stop(self):
+        """Stop the broadcast consumer and per-client sender tasks"""
+        self._has_listeners = False
+        senders = list(self._senders.values())
+        for sender in senders:
+            sender.cancel()
+        self._senders.clear()
+        self._outboxes.clear()
+        self._batching.clear()
+        # Reap the cancelled senders; their CancelledErrors are expected
+        await asyncio.gather(*senders, return_exceptions=True)
+
+        if self._consumer_task and not self._consumer_task.done():
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            logger.info("📡 Broadcast consumer stopped")
+        self._consumer_task = None
 
-    def stop_broadcast_thread(self):
-        """Stop the background thread"""
-        self.is_running = False
-        if self.broadcast_thread:
-            self.broadcast_thread.join(timeout=1.0)
-            logger.info("📡 Broadcast thread stopped")
+    async def _broadcast_consumer(self):
+        """Send queued data to all connections from the server's event loop"""
+        while True:
+            batch = await self._next_batch()
+            try:
+                self._send_batch(batch)
+            except Exception as e:
+                logger.error(f"Error in broadcast consumer: {e}")
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Wait for queued data, then coalesce whatever arrives within the window"""
+        batch = [await self.broadcast_queue.get()]
+        deadline = self.loop.time() + BROADCAST_COALESCE_WINDOW
+        while len(batch) < BROADCAST_BATCH_SIZE:
+            if not self.broadcast_queue.empty():
+                batch.append(self.broadcast_queue.get_nowait())
+                continue
+            # Only joint_batch clients benefit from waiting; everyone else gets frames unrolled
+            if not self._batching:
+                break
+            remaining = deadline - self.loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(self.broadcast_queue.get(), timeout=remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+        return batch
 
-    def _broadcast_worker(self):
-        """Background worker thread for broadcasting WebSocket data"""
-        import asyncio
+    def _send_batch(self, batch: List[Dict[str, Any]]):
+        """Queue a coalesced batch, as joint_batch frames only for clients that opted in"""
+        if not self._outboxes:
+            return
 
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # A lone update keeps its original shape for every client
+        if len(batch) == 1:
+            self._send_to_all_connections(batch[0])
+            return
 
-        try:
-            while self.is_running:
-                try:
-                    # Get data from queue with timeout
-                    data = self.broadcast_queue.get(timeout=0.1)
-                    if data is None:  # Poison pill to stop
-                        break
-
-                    # Broadcast to all connections
-                    if self.active_connections:
-                        loop.run_until_complete(self._send_to_all_connections(data))
-
-                except queue.Empty:
-                    continue
-                except Exception as e:
-                    logger.error(f"Error in broadcast worker: {e}")
-
-        finally:
-            loop.close()
-
-    async def _send_to_all_connections(self, data: Dict[str, Any]):
-        """Send data to all active WebSocket connections"""
-        if not self.active_connections:
+        # Each frame is serialized once and shared by every client receiving it
+        batched = set(self._batching)
+        legacy = set(self._outboxes) - batched
+        if batched:
+            self._send_to_all_connections({"type": "joint_batch", "batch": batch}, batched)
+        if legacy:
+            for data in batch:
+                self._send_to_all_connections(data, legacy)
+
+    def _send_to_all_connections(
+        self, data: Dict[str, Any], targets: Optional[Set[WebSocket]] = None
+    ):
+        """Queue data for every active WebSocket connection, or just the given targets"""
+        if not self._outboxes:
             return
 
-        disconnected = []
-        for connection in self.active_connections:
+        # Serialize once for every client; text frames so browsers can JSON.parse them
+        payload = orjson.dumps(data, option=ORJSON_OPTIONS).decode()
+        # put_nowait never blocks, so the fan-out runs without yielding to the loop
+        if targets is None:
+            outboxes = self._outboxes.values()
+        else:
+            outboxes = [self._outboxes[ws] for ws in targets if ws in self._outboxes]
+        for outbox in outboxes:
             try:
-                await connection.send_json(data)
-            except Exception as e:
-                logger.error(f"Error sending data to WebSocket: {e}")
-                disconnected.append(connection)
-
-        # Remove disconnected connections
-        for connection in disconnected:
-            self.disconnect(connection)
+                outbox.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Client is falling behind: drop its oldest frame in favour of the newest
+                outbox.get_nowait()
+                outbox.put_nowait(payload)
+
+    def _try_put(self, data: Dict[str, Any]):
+        """Enqueue data for the consumer; runs on the event loop"""
+        try:
+            self.broadcast_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("Broadcast queue is full, dropping data")
 
     def broadcast_joint_data_sync(self, data: Dict[str, Any]):
         """Thread-safe method to queue data for broadcasting"""
-        if self.is_running and self.active_connections:
+        # Called at sensor rate from worker threads; free when no dashboard is open
+        if not self._has_listeners:
+            return
+        if self.loop is not None:
             try:
-                self.broadcast_queue.put_nowait(data)
-            except queue.Full:
-                logger.warning("Broadcast queue is full, dropping data")
+                self.loop.call_soon_threadsafe(self._try_put, data)
+            except RuntimeError:
+                # Event loop already closed during shutdown
+                pass
 
 
 manager = ConnectionManager()
@@ -211,17 +305,81 @@ def read_root():
     return FileResponse("app/static/index.html")
 
 
+# Calibration config directories, resolved once instead of joined per request
+_FOLLOWER_DIR = Path(FOLLOWER_CONFIG_PATH)
+_LEADER_DIR = Path(LEADER_CONFIG_PATH)
+_CALIBRATION_DIRS: Dict[str, Path] = {"robot": _FOLLOWER_DIR, "teleop": _LEADER_DIR}
+
+
+def _dir_mtime_ns(path: Union[str, Path]) -> Optional[int]:
+    """Directory mtime used to invalidate the config listing caches"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _list_json(path: str) -> List[str]:
+    """Names of the JSON files in a directory"""
+    try:
+        with os.scandir(path) as entries:
+            return [e.name for e in entries if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_config_filenames(path: str, mtime_ns: Optional[int]) -> List[str]:
+    """JSON config filenames in a directory, cached per directory mtime"""
+    return _list_json(path)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_calibration_configs(path: Path, mtime_ns: Optional[int]) -> List[Dict[str, Any]]:
+    """Calibration config entries in a directory, cached per directory mtime"""
+    configs = []
+    if mtime_ns is None:
+        return configs
+
+    # scandir yields names and stats in one pass instead of listdir + getsize + getmtime
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    configs.append(
+                        {
+                            "name": os.path.splitext(entry.name)[0],
+                            "filename": entry.name,
+                            "size": stat.st_size,
+                            "modified": stat.st_mtime,
+                        }
+                    )
+    except FileNotFoundError:
+        # Directory removed between the mtime check and the scan
+        pass
+    return configs
+
+
+def _invalidate_config_listings():
+    """Drop cached listings after the app itself writes or removes a config file"""
+    # Rewriting an existing file in place does not change the directory mtime
+    _cached_config_filenames.cache_clear()
+    _cached_calibration_configs.cache_clear()
+
+
+calibration_manager.on_calibration_saved = _invalidate_config_listings
+
+
 @app.get("/get-configs")
 def get_configs():
     # Get all available calibration configs
-    leader_configs = [
-        os.path.basename(f)
-        for f in glob.glob(os.path.join(LEADER_CONFIG_PATH, "*.json"))
-    ]
-    follower_configs = [
-        os.path.basename(f)
-        for f in glob.glob(os.path.join(FOLLOWER_CONFIG_PATH, "*.json"))
-    ]
+    leader_configs = _cached_config_filenames(
+        LEADER_CONFIG_PATH, _dir_mtime_ns(LEADER_CONFIG_PATH)
+    )
+    follower_configs = _cached_config_filenames(
+        FOLLOWER_CONFIG_PATH, _dir_mtime_ns(FOLLOWER_CONFIG_PATH)
+    )
 
     return {"leader_configs": leader_configs, "follower_configs": follower_configs}
 
@@ -269,21 +427,12 @@ async def websocket_endpoint(websocket: WebSocket):
         await manager.connect(websocket)
         logger.info("✅ WebSocket connection established")
 
+        # Outbound data is pushed by the broadcast consumer, so just wait for
+        # incoming messages until the client disconnects
         while True:
-            # Keep the connection alive and wait for messages
-            try:
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=1.0)
-                # Handle any incoming messages if needed
-                logger.debug(f"Received WebSocket message: {data}")
-            except asyncio.TimeoutError:
-                # No message received, continue
-                pass
-            except WebSocketDisconnect:
-                logger.info("🔌 WebSocket client disconnected")
-                break
-
-            # Small delay to prevent excessive CPU usage
-            await asyncio.sleep(0.01)
+            data = await websocket.receive_text()
+            # Handle any incoming messages if needed
+            logger.debug(f"Received WebSocket message: {data}")
 
     except WebSocketDisconnect:
         logger.info("🔌 WebSocket disconnected normally")
@@ -408,13 +557,21 @@ def stop_calibration():
     return calibration_manager.stop_calibration_process()
 
 
+# (status version, serialized body) for /calibration-status, swapped as one tuple
+_calibration_status_cache: Tuple[int, bytes] = (-1, b"")
+
+
 @app.get("/calibration-status")
 def calibration_status():
     """Get current calibration status"""
-    from dataclasses import asdict
-
-    status = calibration_manager.get_status()
-    return asdict(status)
+    global _calibration_status_cache
+    # Read the version before the status: a racing update then only causes one extra re-serialize
+    version = calibration_manager.status_version
+    cached_version, body = _calibration_status_cache
+    if cached_version != version:
+        body = orjson.dumps(calibration_manager.get_status(), option=ORJSON_OPTIONS)
+        _calibration_status_cache = (version, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/complete-calibration-step")
@@ -427,31 +584,12 @@ def complete_calibration_step():
 def get_calibration_configs(device_type: str):
     """Get all calibration config files for a specific device type"""
     try:
-        if device_type == "robot":
-            config_path = FOLLOWER_CONFIG_PATH
-        elif device_type == "teleop":
-            config_path = LEADER_CONFIG_PATH
-        else:
+        config_dir = _CALIBRATION_DIRS.get(device_type)
+        if config_dir is None:
             return {"success": False, "message": "Invalid device type"}
 
         # Get all JSON files in the config directory
-        configs = []
-        if os.path.exists(config_path):
-            for file in os.listdir(config_path):
-                if file.endswith(".json"):
-                    config_name = os.path.splitext(file)[0]
-                    file_path = os.path.join(config_path, file)
-                    file_size = os.path.getsize(file_path)
-                    modified_time = os.path.getmtime(file_path)
-
-                    configs.append(
-                        {
-                            "name": config_name,
-                            "filename": file,
-                            "size": file_size,
-                            "modified": modified_time,
-                        }
-                    )
+        configs = _cached_calibration_configs(config_dir, _dir_mtime_ns(config_dir))
 
         return {"success": True, "configs": configs, "device_type": device_type}
 
@@ -464,23 +602,17 @@ def get_calibration_configs(device_type: str):
 def delete_calibration_config(device_type: str, config_name: str):
     """Delete a calibration config file"""
     try:
-        if device_type == "robot":
-            config_path = FOLLOWER_CONFIG_PATH
-        elif device_type == "teleop":
-            config_path = LEADER_CONFIG_PATH
-        else:
+        config_dir = _CALIBRATION_DIRS.get(device_type)
+        if config_dir is None:
             return {"success": False, "message": "Invalid device type"}
 
-        # Construct the file path
-        filename = f"{config_name}.json"
-        file_path = os.path.join(config_path, filename)
-
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # Delete the file; a missing file surfaces from unlink itself, no separate exists() check
+        file_path = config_dir / f"{config_name}.json"
+        try:
+            file_path.unlink()
+        except FileNotFoundError:
             return {"success": False, "message": "Configuration file not found"}
-
-        # Delete the file
-        os.remove(file_path)
+        _invalidate_config_listings()
         logger.info(f"Deleted calibration config: {file_path}")
 
         return {
@@ -508,35 +640,102 @@ def get_available_ports():
         return {"status": "error", "message": str(e)}
 
 
-@app.get("/available-cameras")
-def get_available_cameras():
-    """Get all available cameras"""
+# Camera probing: indices to try, parallel probes, and consecutive misses before giving up
+MAX_CAMERA_INDEX = 10
+CAMERA_PROBE_WORKERS = 4
+CAMERA_MAX_CONSECUTIVE_MISSES = 2
+# Detected cameras rarely change within a session, so results are reused this long
+CAMERA_CACHE_TTL = 30.0
+
+_camera_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+# Concurrent probes would contend for the same devices and see them as busy
+_camera_probe_lock = asyncio.Lock()
+
+_camera_probe_executor = ThreadPoolExecutor(
+    max_workers=CAMERA_PROBE_WORKERS, thread_name_prefix="camera-probe"
+)
+
+
+def _camera_backend() -> int:
+    """Platform capture backend, so OpenCV skips probing every backend in turn"""
+    system = platform.system()
+    if system == "Windows":
+        return cv2.CAP_DSHOW
+    if system == "Linux":
+        return cv2.CAP_V4L2
+    return cv2.CAP_ANY
+
+
+def _probe_camera(index: int):
+    """Open one camera index; returns (opened, camera info or None)"""
+    cap = cv2.VideoCapture(index, _camera_backend())
     try:
-        # Try to detect cameras using OpenCV
-        import cv2
-        cameras = []
-        
-        # Test up to 10 camera indices
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret:
-                    cameras.append({
-                        "index": i,
-                        "name": f"Camera {i}",
-                        "available": True,
-                        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                        "fps": int(cap.get(cv2.CAP_PROP_FPS)),
-                    })
-                cap.release()
-            
-        return {"status": "success", "cameras": cameras}
-    except ImportError:
+        if not cap.isOpened():
+            return False, None
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Properties are available right after open on most backends
+        camera = {
+            "index": index,
+            "name": f"Camera {index}",
+            "available": True,
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": int(cap.get(cv2.CAP_PROP_FPS)),
+        }
+        # grab() proves a frame arrives without decoding/converting it like read() does
+        if not cap.grab():
+            return True, None
+        return True, camera
+    finally:
+        cap.release()
+
+
+async def _detect_cameras() -> List[Dict[str, Any]]:
+    """Probe camera indices and return the ones that deliver frames"""
+    loop = asyncio.get_running_loop()
+    cameras = []
+    misses = 0
+
+    # Probe indices a batch at a time off the event loop; camera indices are
+    # usually contiguous, so stop after a run of indices that fail to open
+    for start in range(0, MAX_CAMERA_INDEX, CAMERA_PROBE_WORKERS):
+        indices = range(start, min(start + CAMERA_PROBE_WORKERS, MAX_CAMERA_INDEX))
+        results = await asyncio.gather(
+            *(loop.run_in_executor(_camera_probe_executor, _probe_camera, i) for i in indices)
+        )
+        for opened, camera in results:
+            misses = 0 if opened else misses + 1
+            if misses >= CAMERA_MAX_CONSECUTIVE_MISSES:
+                break
+            if camera:
+                cameras.append(camera)
+        if misses >= CAMERA_MAX_CONSECUTIVE_MISSES:
+            break
+
+    return cameras
+
+
+@app.get("/available-cameras")
+async def get_available_cameras(refresh: bool = False):
+    """Get all available cameras (cached; pass ?refresh=1 to re-probe)"""
+    if not _HAVE_CV2:
         # OpenCV not available, return empty list
         logger.warning("OpenCV not available for camera detection")
         return {"status": "success", "cameras": []}
+
+    try:
+        # Detect cameras using OpenCV
+        async with _camera_probe_lock:
+            if (
+                refresh
+                or _camera_cache["data"] is None
+                or time.monotonic() - _camera_cache["ts"] >= CAMERA_CACHE_TTL
+            ):
+                _camera_cache["data"] = await _detect_cameras()
+                _camera_cache["ts"] = time.monotonic()
+            cameras = _camera_cache["data"]
+            
+        return {"status": "success", "cameras": cameras}
     except Exception as e:
         logger.error(f"Error detecting cameras: {e}")
         return {"status": "error", "message": str(e), "cameras": []}
@@ -651,10 +850,11 @@ async def shutdown_event():
     # Stop any active recording - handled by recording module cleanup
 
     # Clean up replay resources
-    from .replaying import cleanup as replay_cleanup
-
     replay_cleanup()
 
+    # Stopping waits up to 5 s for the worker; keep that off the event loop
+    await asyncio.to_thread(calibration_manager.shutdown)
+
     if manager:
-        manager.stop_broadcast_thread()
+        await manager.stop()
     logger.info("✅ Cleanup completed")
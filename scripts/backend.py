@@ -15,7 +15,13 @@ def main():
     """Start the FastAPI backend server only"""
     logger.info("🚀 Starting LeLab FastAPI backend server...")
     uvicorn.run(
-        "app.main:app", host="0.0.0.0", port=8000, reload=True, log_level="info"
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        log_level="info",
+        # Joint frames are small and serialized once per broadcast; per-client deflate only costs CPU
+        ws_per_message_deflate=False,
     )
 
 
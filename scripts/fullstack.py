@@ -154,6 +154,8 @@ def start_backend_detached():
                 "--port",
                 "8000",
                 "--reload",
+                "--ws-per-message-deflate",
+                "false",
             ],
             cwd=project_root,  # Set working directory to project root
             env=env,  # Preserve environment variables
@@ -19,7 +19,8 @@ class WebSocketManager {
     private url: string;
     private isIntentionallyClosed = false;
 
-    constructor(url: string = `${WS_URL}/ws/joint-data`) {
+    // batch=1 opts in to joint_batch frames carrying several coalesced updates
+    constructor(url: string = `${WS_URL}/ws/joint-data?batch=1`) {
         this.url = url;
     }
 
@@ -42,7 +43,11 @@ class WebSocketManager {
             this.ws.onmessage = (event) => {
                 try {
                     const data = JSON.parse(event.data);
-                    this.callbacks.forEach((callback) => callback(data));
+                    // The backend coalesces closely spaced updates into a single frame
+                    const updates: JointData[] = data.type === 'joint_batch' ? data.batch : [data];
+                    updates.forEach((update) => {
+                        this.callbacks.forEach((callback) => callback(update));
+                    });
                 } catch (error) {
                     console.error('Error parsing WebSocket message:', error);
                 }